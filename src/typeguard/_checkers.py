@@ -6,11 +6,14 @@ import sys
 import types
 import typing
 import warnings
-from collections.abc import Mapping, MutableMapping, Sequence
+from array import array
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from enum import Enum
-from inspect import Parameter, isclass, isfunction
+from functools import lru_cache
+from inspect import Parameter, isclass, isfunction, ismethod
 from io import BufferedIOBase, IOBase, RawIOBase, TextIOBase
-from itertools import zip_longest
+from itertools import repeat, zip_longest
+from operator import is_
 from textwrap import indent
 from typing import (
     IO,
@@ -32,6 +35,7 @@ from typing import (
     Union,
 )
 from unittest.mock import Mock
+from weakref import WeakKeyDictionary
 
 import typing_extensions
 
@@ -77,6 +81,9 @@ TypeCheckerCallable: TypeAlias = Callable[
 TypeCheckLookupCallback: TypeAlias = Callable[
     [Any, Tuple[Any, ...], Tuple[Any, ...]], Optional[TypeCheckerCallable]
 ]
+SignatureInfo: TypeAlias = Tuple[
+    inspect.Signature, Tuple[Tuple[str, ...], int, int, bool]
+]
 
 checker_lookup_functions: list[TypeCheckLookupCallback] = []
 generic_alias_types: tuple[type, ...] = (
@@ -88,6 +95,57 @@ generic_alias_types: tuple[type, ...] = (
 # Sentinel
 _missing = object()
 
+# Values whose exact type is one of these trivially match an annotation of that type
+_simple_builtin_types = frozenset([bool, bytes, float, int, str])
+
+# Cache of (declared keys, required keys, annotations) per TypedDict class
+_typed_dict_info_cache: WeakKeyDictionary[
+    type, tuple[frozenset[str], frozenset[str], dict[str, Any]]
+] = WeakKeyDictionary()
+
+# Cache of (sorted member names, resolved annotations) per protocol class
+_protocol_info_cache: WeakKeyDictionary[
+    type, tuple[tuple[str, ...], dict[str, Any]]
+] = WeakKeyDictionary()
+
+# Cache of the checker (or lack thereof) for classes not in origin_type_checkers
+_class_checker_cache: WeakKeyDictionary[type, TypeCheckerCallable | None] = (
+    WeakKeyDictionary()
+)
+
+# Cache of whether each class passes all of its instances, valid for as long as
+# checker_lookup_functions and origin_type_checkers match the copies kept alongside
+_plain_class_cache: WeakKeyDictionary[type, bool] = WeakKeyDictionary()
+_plain_class_cache_lookup_functions: list[TypeCheckLookupCallback] = []
+_plain_class_cache_origin_type_checkers: dict[Any, TypeCheckerCallable] = {}
+
+# Caches of signatures of plain functions, and of methods bound to them (keyed on the
+# function), along with their parameter counts and the function attributes they were
+# determined from
+_signature_cache: WeakKeyDictionary[
+    Callable[..., Any], tuple[tuple[Any, ...], SignatureInfo]
+] = WeakKeyDictionary()
+_bound_method_signature_cache: WeakKeyDictionary[
+    Callable[..., Any], tuple[tuple[Any, ...], SignatureInfo]
+] = WeakKeyDictionary()
+
+# Types of the items of array.array objects, keyed by type code
+array_item_types: dict[str, type] = {
+    **dict.fromkeys("bBhHiIlLqQ", int),
+    **dict.fromkeys("fd", float),
+    **dict.fromkeys("uw", str),
+}
+
+# Accepted base classes and their description, keyed by the I/O type or by the type
+# argument of a parametrized IO
+io_type_checks: dict[Any, tuple[tuple[type, ...], str]] = {
+    TextIO: ((TextIOBase,), "a text based I/O object"),
+    str: ((TextIOBase,), "a text based I/O object"),
+    BinaryIO: ((RawIOBase, BufferedIOBase), "a binary I/O object"),
+    bytes: ((RawIOBase, BufferedIOBase), "a binary I/O object"),
+    IO: ((IOBase,), "an I/O object"),
+}
+
 # Lifted from mypy.sharedparse
 BINARY_MAGIC_METHODS = {
     "__add__",
@@ -143,6 +201,108 @@ BINARY_MAGIC_METHODS = {
 }
 
 
+def get_signature_inputs(func: types.FunctionType) -> tuple[Any, ...]:
+    """
+    Return the attributes of a function that its signature is derived from.
+
+    Cached signatures and parameter counts are only reused while these stay the same
+    objects, so that reassigning ``__defaults__``, ``__signature__`` and the like takes
+    effect. Mutating them in place is not detected.
+
+    """
+    return (
+        func.__code__,
+        func.__defaults__,
+        func.__kwdefaults__,
+        getattr(func, "__signature__", None),
+        getattr(func, "__wrapped__", None),
+    )
+
+
+def get_signature_info(func: Callable[..., Any]) -> SignatureInfo:
+    """
+    Return the signature of the given callable along with its parameter counts.
+
+    The parameter counts are the names of the mandatory keyword-only parameters, the
+    number of positional parameters, the number of mandatory positional parameters and
+    whether the callable accepts ``*args``.
+
+    The results for plain functions, and for methods bound to them, are cached per
+    function object (see :func:`get_signature_inputs`). Other callables (classes,
+    builtins etc.) are introspected on every call.
+
+    """
+    if isfunction(func):
+        cache = _signature_cache
+        key = func
+    elif ismethod(func) and isfunction(func.__func__):
+        # The signature of a bound method only depends on the underlying function
+        cache = _bound_method_signature_cache
+        key = func.__func__
+    else:
+        cache = None
+
+    if cache is not None:
+        inputs = get_signature_inputs(key)
+        try:
+            cached_inputs, cached_info = cache[key]
+        except KeyError:
+            pass
+        else:
+            if all(map(is_, inputs, cached_inputs)):
+                return cached_info
+
+    signature = inspect.signature(func)
+    mandatory_kwonlyargs: list[str] = []
+    num_positional_args = num_mandatory_pos_args = 0
+    has_varargs = False
+    for param in signature.parameters.values():
+        if param.kind in (
+            Parameter.POSITIONAL_ONLY,
+            Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            num_positional_args += 1
+            if param.default is Parameter.empty:
+                num_mandatory_pos_args += 1
+        elif param.kind == Parameter.VAR_POSITIONAL:
+            has_varargs = True
+        elif param.kind == Parameter.KEYWORD_ONLY and param.default is Parameter.empty:
+            mandatory_kwonlyargs.append(param.name)
+
+    info = (
+        signature,
+        (
+            tuple(mandatory_kwonlyargs),
+            num_positional_args,
+            num_mandatory_pos_args,
+            has_varargs,
+        ),
+    )
+    if cache is not None:
+        cache[key] = inputs, info
+
+    return info
+
+
+def get_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Return the (cached) signature of the given callable."""
+    return get_signature_info(func)[0]
+
+
+def all_of_plain_class(values: Iterable[Any], args: tuple[Any, ...]) -> bool:
+    """
+    Return ``True`` if the item type in the given collection type arguments is a plain
+    class and every value is an instance of it.
+
+    This lets collection checks skip the per-item dispatch in the common case of
+    homogeneous collections. A ``False`` result means the items need to be checked
+    individually.
+
+    """
+    classes = get_plain_classes(args)
+    return bool(classes) and all(map(isinstance, values, repeat(classes)))
+
+
 def check_callable(
     value: Any,
     origin_type: Any,
@@ -153,41 +313,27 @@ def check_callable(
         raise TypeCheckError("is not callable")
 
     if args:
-        try:
-            signature = inspect.signature(value)
-        except (TypeError, ValueError):
-            return
-
         argument_types = args[0]
         if isinstance(argument_types, list) and not any(
             type(item) is ParamSpec for item in argument_types
         ):
+            try:
+                (
+                    unfulfilled_kwonlyargs,
+                    num_positional_args,
+                    num_mandatory_pos_args,
+                    has_varargs,
+                ) = get_signature_info(value)[1]
+            except (TypeError, ValueError):
+                return
+
             # The callable must not have keyword-only arguments without defaults
-            unfulfilled_kwonlyargs = [
-                param.name
-                for param in signature.parameters.values()
-                if param.kind == Parameter.KEYWORD_ONLY
-                and param.default == Parameter.empty
-            ]
             if unfulfilled_kwonlyargs:
                 raise TypeCheckError(
                     f"has mandatory keyword-only arguments in its declaration: "
                     f'{", ".join(unfulfilled_kwonlyargs)}'
                 )
 
-            num_positional_args = num_mandatory_pos_args = 0
-            has_varargs = False
-            for param in signature.parameters.values():
-                if param.kind in (
-                    Parameter.POSITIONAL_ONLY,
-                    Parameter.POSITIONAL_OR_KEYWORD,
-                ):
-                    num_positional_args += 1
-                    if param.default is Parameter.empty:
-                        num_mandatory_pos_args += 1
-                elif param.kind == Parameter.VAR_POSITIONAL:
-                    has_varargs = True
-
             if num_mandatory_pos_args > len(argument_types):
                 raise TypeCheckError(
                     f"has too many mandatory positional arguments in its declaration; "
@@ -208,10 +354,11 @@ def check_mapping(
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
 ) -> None:
-    if origin_type is Dict or origin_type is dict:
-        if not isinstance(value, dict):
-            raise TypeCheckError("is not a dict")
-    if origin_type is MutableMapping or origin_type is collections.abc.MutableMapping:
+    if isinstance(value, dict):
+        pass  # always a mutable mapping; skip the slower ABC instance checks
+    elif origin_type is Dict or origin_type is dict:
+        raise TypeCheckError("is not a dict")
+    elif origin_type is MutableMapping or origin_type is collections.abc.MutableMapping:
         if not isinstance(value, collections.abc.MutableMapping):
             raise TypeCheckError("is not a mutable mapping")
     elif not isinstance(value, collections.abc.Mapping):
@@ -223,6 +370,24 @@ def check_mapping(
             samples = memo.config.collection_check_strategy.iterate_samples(
                 value.items()
             )
+            key_classes = (
+                (object,) if key_type is Any else get_plain_classes((key_type,))
+            )
+            value_classes = (
+                (object,) if value_type is Any else get_plain_classes((value_type,))
+            )
+            if key_classes and value_classes:
+                if all(
+                    isinstance(k, key_classes) and isinstance(v, value_classes)
+                    for k, v in samples
+                ):
+                    return
+
+                # Start over, as items() may have returned a one-shot iterator
+                samples = memo.config.collection_check_strategy.iterate_samples(
+                    value.items()
+                )
+
             for k, v in samples:
                 try:
                     check_type_internal(k, key_type, memo)
@@ -237,6 +402,41 @@ def check_mapping(
                     raise
 
 
+def get_typed_dict_info(
+    typed_dict: Any,
+) -> tuple[frozenset[str], frozenset[str], dict[str, Any]]:
+    """
+    Return the declared keys, required keys and annotations of a TypedDict class.
+
+    The result is cached per class. Forward references in the annotations are left
+    unresolved, as resolving them depends on the memo of the check being made.
+
+    """
+    try:
+        return _typed_dict_info_cache[typed_dict]
+    except KeyError:
+        pass
+
+    declared_keys = frozenset(typed_dict.__annotations__)
+    if hasattr(typed_dict, "__required_keys__"):
+        required_keys = set(typed_dict.__required_keys__)
+    else:  # py3.8 and lower
+        required_keys = set(declared_keys) if typed_dict.__total__ else set()
+
+    # Detect NotRequired fields which are hidden by get_type_hints()
+    annotations: dict[str, Any] = {}
+    for key, annotation in typed_dict.__annotations__.items():
+        if get_origin(annotation) is NotRequired:
+            required_keys.discard(key)
+            annotation = get_args(annotation)[0]
+
+        annotations[key] = annotation
+
+    info = declared_keys, frozenset(required_keys), annotations
+    _typed_dict_info_cache[typed_dict] = info
+    return info
+
+
 def check_typed_dict(
     value: Any,
     origin_type: Any,
@@ -246,29 +446,26 @@ def check_typed_dict(
     if not isinstance(value, dict):
         raise TypeCheckError("is not a dict")
 
-    declared_keys = frozenset(origin_type.__annotations__)
-    if hasattr(origin_type, "__required_keys__"):
-        required_keys = set(origin_type.__required_keys__)
-    else:  # py3.8 and lower
-        required_keys = set(declared_keys) if origin_type.__total__ else set()
-
+    declared_keys, required_keys, annotations = get_typed_dict_info(origin_type)
     existing_keys = set(value)
     extra_keys = existing_keys - declared_keys
     if extra_keys:
         keys_formatted = ", ".join(f'"{key}"' for key in sorted(extra_keys, key=repr))
         raise TypeCheckError(f"has unexpected extra key(s): {keys_formatted}")
 
-    # Detect NotRequired fields which are hidden by get_type_hints()
-    type_hints: dict[str, type] = {}
-    for key, annotation in origin_type.__annotations__.items():
+    # Forward references can only be resolved against the current memo
+    type_hints: dict[str, Any] = annotations
+    for key, annotation in annotations.items():
         if isinstance(annotation, ForwardRef):
-            annotation = evaluate_forwardref(annotation, memo)
+            if type_hints is annotations:
+                type_hints = annotations.copy()
 
-        if get_origin(annotation) is NotRequired:
-            required_keys.discard(key)
-            annotation = get_args(annotation)[0]
+            annotation = evaluate_forwardref(annotation, memo)
+            if get_origin(annotation) is NotRequired:
+                required_keys -= {key}
+                annotation = get_args(annotation)[0]
 
-        type_hints[key] = annotation
+            type_hints[key] = annotation
 
     missing_keys = required_keys - existing_keys
     if missing_keys:
@@ -296,6 +493,9 @@ def check_list(
 
     if args and args != (Any,):
         samples = memo.config.collection_check_strategy.iterate_samples(value)
+        if all_of_plain_class(samples, args):
+            return
+
         for i, v in enumerate(samples):
             try:
                 check_type_internal(v, args[0], memo)
@@ -310,11 +510,20 @@ def check_sequence(
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
 ) -> None:
-    if not isinstance(value, collections.abc.Sequence):
+    if not isinstance(value, (list, tuple, str, bytes)) and not isinstance(
+        value, collections.abc.Sequence
+    ):
         raise TypeCheckError("is not a sequence")
 
     if args and args != (Any,):
+        # The items of an array all have the type implied by its type code
+        if isinstance(value, array) and array_item_types.get(value.typecode) is args[0]:
+            return
+
         samples = memo.config.collection_check_strategy.iterate_samples(value)
+        if all_of_plain_class(samples, args):
+            return
+
         for i, v in enumerate(samples):
             try:
                 check_type_internal(v, args[0], memo)
@@ -332,11 +541,16 @@ def check_set(
     if origin_type is frozenset:
         if not isinstance(value, frozenset):
             raise TypeCheckError("is not a frozenset")
-    elif not isinstance(value, AbstractSet):
+    elif not isinstance(value, (set, frozenset)) and not isinstance(
+        value, collections.abc.Set
+    ):
         raise TypeCheckError("is not a set")
 
     if args and args != (Any,):
         samples = memo.config.collection_check_strategy.iterate_samples(value)
+        if all_of_plain_class(samples, args):
+            return
+
         for v in samples:
             try:
                 check_type_internal(v, args[0], memo)
@@ -351,8 +565,12 @@ def check_tuple(
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
 ) -> None:
-    # Specialized check for NamedTuples
-    if field_types := getattr(origin_type, "__annotations__", None):
+    if origin_type is tuple:
+        # Plain tuple; skip looking for NamedTuple fields
+        if not isinstance(value, tuple):
+            raise TypeCheckError("is not a tuple")
+    elif field_types := getattr(origin_type, "__annotations__", None):
+        # Specialized check for NamedTuples
         if not isinstance(value, origin_type):
             raise TypeCheckError(
                 f"is not a named tuple of type {qualified_name(origin_type)}"
@@ -369,33 +587,38 @@ def check_tuple(
     elif not isinstance(value, tuple):
         raise TypeCheckError("is not a tuple")
 
-    if args:
-        use_ellipsis = args[-1] is Ellipsis
-        tuple_params = args[: -1 if use_ellipsis else None]
-    else:
+    if not args:
         # Unparametrized Tuple or plain tuple
         return
 
-    if use_ellipsis:
-        element_type = tuple_params[0]
+    if args[-1] is Ellipsis:
+        element_type = args[0]
         samples = memo.config.collection_check_strategy.iterate_samples(value)
+        if all_of_plain_class(samples, (element_type,)):
+            return
+
         for i, element in enumerate(samples):
             try:
                 check_type_internal(element, element_type, memo)
             except TypeCheckError as exc:
                 exc.append_path_element(f"item {i}")
                 raise
-    elif tuple_params == ((),):
+    elif args == ((),):
         if value != ():
             raise TypeCheckError("is not an empty tuple")
     else:
-        if len(value) != len(tuple_params):
+        if len(value) != len(args):
             raise TypeCheckError(
-                f"has wrong number of elements (expected {len(tuple_params)}, got "
+                f"has wrong number of elements (expected {len(args)}, got "
                 f"{len(value)} instead)"
             )
 
-        for i, (element, element_type) in enumerate(zip(value, tuple_params)):
+        if len(get_plain_classes(args)) == len(args) and all(
+            map(isinstance, value, args)
+        ):
+            return
+
+        for i, (element, element_type) in enumerate(zip(value, args)):
             try:
                 check_type_internal(element, element_type, memo)
             except TypeCheckError as exc:
@@ -403,24 +626,100 @@ def check_tuple(
                 raise
 
 
+def is_plain_class(annotation: Any) -> bool:
+    """
+    Return ``True`` if every instance of the annotation is known to pass its check.
+
+    This holds for classes that have no dedicated checker, or whose checker is known
+    to accept all of their instances when unparametrized (``float``, ``dict`` and the
+    like).
+
+    The result is cached per class until :data:`checker_lookup_functions` or
+    :data:`origin_type_checkers` is changed.
+
+    """
+    if annotation is Any or annotation is SubclassableAny or not isclass(annotation):
+        return False
+
+    if (
+        _plain_class_cache_lookup_functions != checker_lookup_functions
+        or _plain_class_cache_origin_type_checkers != origin_type_checkers
+    ):
+        _plain_class_cache.clear()
+        _plain_class_cache_lookup_functions[:] = checker_lookup_functions
+        _plain_class_cache_origin_type_checkers.clear()
+        _plain_class_cache_origin_type_checkers.update(origin_type_checkers)
+
+    try:
+        return _plain_class_cache[annotation]
+    except KeyError:
+        pass
+
+    _plain_class_cache[annotation] = plain = _is_plain_class(annotation)
+    return plain
+
+
+def _is_plain_class(annotation: type) -> bool:
+    if get_origin(annotation) is not None:
+        return False
+
+    for lookup_func in checker_lookup_functions:
+        if lookup_func is not builtin_checker_lookup and lookup_func(
+            annotation, (), ()
+        ):
+            return False
+
+    checker = origin_type_checkers.get(annotation)
+    if checker is not None:
+        return checker in _unparametrized_passing_checkers
+
+    return lookup_class_checker(annotation) is None
+
+
+def get_plain_classes(annotations: tuple[Any, ...]) -> tuple[type, ...]:
+    """
+    Return the annotations that pass any instance of themselves.
+
+    This is used to match union members and collection items with a single
+    :func:`isinstance` call.
+
+    """
+    return tuple([arg for arg in annotations if is_plain_class(arg)])
+
+
+def format_union_errors(errors: list[tuple[Any, TypeCheckError]]) -> str:
+    """
+    Format the errors from checking a value against each member of a union.
+
+    The type names are only looked up here, so that checks that end up matching a
+    later member of the union don't pay for formatting the earlier mismatches.
+
+    """
+    named_errors = {get_type_name(type_): exc for type_, exc in errors}
+    return indent(
+        "\n".join(f"{key}: {error}" for key, error in named_errors.items()), "  "
+    )
+
+
 def check_union(
     value: Any,
     origin_type: Any,
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
 ) -> None:
-    errors: dict[str, TypeCheckError] = {}
+    if isinstance(value, get_plain_classes(args)):
+        return
+
+    errors: list[tuple[Any, TypeCheckError]] = []
     try:
         for type_ in args:
             try:
                 check_type_internal(value, type_, memo)
                 return
             except TypeCheckError as exc:
-                errors[get_type_name(type_)] = exc
+                errors.append((type_, exc))
 
-        formatted_errors = indent(
-            "\n".join(f"{key}: {error}" for key, error in errors.items()), "  "
-        )
+        formatted_errors = format_union_errors(errors)
     finally:
         del errors  # avoid creating ref cycle
 
@@ -436,18 +735,19 @@ def check_uniontype(
     if not args:
         return check_instance(value, types.UnionType, (), memo)
 
-    errors: dict[str, TypeCheckError] = {}
+    if isinstance(value, get_plain_classes(args)):
+        return
+
+    errors: list[tuple[Any, TypeCheckError]] = []
     try:
         for type_ in args:
             try:
                 check_type_internal(value, type_, memo)
                 return
             except TypeCheckError as exc:
-                errors[get_type_name(type_)] = exc
+                errors.append((type_, exc))
 
-        formatted_errors = indent(
-            "\n".join(f"{key}: {error}" for key, error in errors.items()), "  "
-        )
+        formatted_errors = format_union_errors(errors)
     finally:
         del errors  # avoid creating ref cycle
 
@@ -480,7 +780,7 @@ def check_class(
     elif isinstance(expected_class, TypeVar):
         check_typevar(value, expected_class, (), memo, subclass_check=True)
     elif get_origin(expected_class) is Union:
-        errors: dict[str, TypeCheckError] = {}
+        errors: list[tuple[Any, TypeCheckError]] = []
         try:
             for arg in get_args(expected_class):
                 if arg is Any:
@@ -490,11 +790,9 @@ def check_class(
                     check_class(value, type, (arg,), memo)
                     return
                 except TypeCheckError as exc:
-                    errors[get_type_name(arg)] = exc
+                    errors.append((arg, exc))
             else:
-                formatted_errors = indent(
-                    "\n".join(f"{key}: {error}" for key, error in errors.items()), "  "
-                )
+                formatted_errors = format_union_errors(errors)
                 raise TypeCheckError(
                     f"did not match any element in the union:\n{formatted_errors}"
                 )
@@ -537,6 +835,11 @@ def check_typevar(
         )
         check_type_internal(value, annotation, memo)
     elif origin_type.__constraints__:
+        if not subclass_check and isinstance(
+            value, get_plain_classes(origin_type.__constraints__)
+        ):
+            return
+
         for constraint in origin_type.__constraints__:
             annotation = Type[constraint] if subclass_check else constraint
             try:
@@ -558,34 +861,61 @@ def _is_literal_type(typ: object) -> bool:
     return typ is typing.Literal or typ is typing_extensions.Literal
 
 
+def get_literal_args(literal_args: tuple[Any, ...]) -> tuple[Any, ...]:
+    retval: list[Any] = []
+    for arg in literal_args:
+        if _is_literal_type(get_origin(arg)):
+            retval.extend(get_literal_args(arg.__args__))
+        elif arg is None or isinstance(arg, (int, str, bytes, bool, Enum)):
+            retval.append(arg)
+        else:
+            # TypeError here is deliberate
+            raise TypeError(f"Illegal literal value: {arg}")
+
+    return tuple(retval)
+
+
+@lru_cache(maxsize=256)
+def get_literal_info(
+    typed_args: tuple[tuple[type, Any], ...],
+) -> tuple[tuple[Any, ...], frozenset[tuple[type, Any]]]:
+    """
+    Return the flattened values of a ``Literal`` and their (type, value) pairs.
+
+    The arguments are given as (type, value) pairs, as equal values of different types
+    (like ``1`` and ``True``) hash the same. The cache is bounded, as the values may
+    include enum members that would otherwise keep their classes alive.
+
+    """
+    final_args = get_literal_args(tuple([arg for _, arg in typed_args]))
+    return final_args, frozenset((type(arg), arg) for arg in final_args)
+
+
 def check_literal(
     value: Any,
     origin_type: Any,
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
 ) -> None:
-    def get_literal_args(literal_args: tuple[Any, ...]) -> tuple[Any, ...]:
-        retval: list[Any] = []
-        for arg in literal_args:
-            if _is_literal_type(get_origin(arg)):
-                retval.extend(get_literal_args(arg.__args__))
-            elif arg is None or isinstance(arg, (int, str, bytes, bool, Enum)):
-                retval.append(arg)
-            else:
-                raise TypeError(
-                    f"Illegal literal value: {arg}"
-                )  # TypeError here is deliberate
-
-        return tuple(retval)
-
-    final_args = tuple(get_literal_args(args))
+    typed_args: frozenset[tuple[type, Any]] | None
     try:
-        index = final_args.index(value)
-    except ValueError:
-        pass
-    else:
-        if type(final_args[index]) is type(value):
-            return
+        final_args, typed_args = get_literal_info(
+            tuple([(type(arg), arg) for arg in args])
+        )
+    except TypeError:
+        # Unhashable values can't be cached (and illegal ones are reported from here)
+        final_args = get_literal_args(args)
+        typed_args = None
+
+    # Pair each value with its type so that, for example, True won't match 1
+    if typed_args is not None:
+        try:
+            if (type(value), value) in typed_args:
+                return
+        except TypeError:
+            pass  # an unhashable value can't be of the same type as any literal value
+    elif any(type(arg) is type(value) and arg == value for arg in final_args):
+        return
 
     formatted_args = ", ".join(repr(arg) for arg in final_args)
     raise TypeCheckError(f"is not any of ({formatted_args})") from None
@@ -637,19 +967,15 @@ def check_io(
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
 ) -> None:
-    if origin_type is TextIO or (origin_type is IO and args == (str,)):
-        if not isinstance(value, TextIOBase):
-            raise TypeCheckError("is not a text based I/O object")
-    elif origin_type is BinaryIO or (origin_type is IO and args == (bytes,)):
-        if not isinstance(value, (RawIOBase, BufferedIOBase)):
-            raise TypeCheckError("is not a binary I/O object")
-    elif not isinstance(value, IOBase):
-        raise TypeCheckError("is not an I/O object")
+    key = args[0] if origin_type is IO and len(args) == 1 else origin_type
+    base_classes, description = io_type_checks.get(key, io_type_checks[IO])
+    if not isinstance(value, base_classes):
+        raise TypeCheckError(f"is not {description}")
 
 
 def check_signature_compatible(subject: type, protocol: type, attrname: str) -> None:
-    subject_sig = inspect.signature(getattr(subject, attrname))
-    protocol_sig = inspect.signature(getattr(protocol, attrname))
+    subject_sig = get_signature(getattr(subject, attrname))
+    protocol_sig = get_signature(getattr(protocol, attrname))
     protocol_type: typing.Literal["instance", "class", "static"] = "instance"
     subject_type: typing.Literal["instance", "class", "static"] = "instance"
 
@@ -791,14 +1117,34 @@ def check_signature_compatible(subject: type, protocol: type, attrname: str) ->
             )
 
 
+def get_protocol_info(protocol: type) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Return the sorted member names and the resolved annotations of a protocol class.
+
+    The result is cached per class.
+
+    """
+    try:
+        return _protocol_info_cache[protocol]
+    except KeyError:
+        pass
+
+    info = (
+        tuple(sorted(typing_extensions.get_protocol_members(protocol))),
+        typing.get_type_hints(protocol),
+    )
+    _protocol_info_cache[protocol] = info
+    return info
+
+
 def check_protocol(
     value: Any,
     origin_type: Any,
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
 ) -> None:
-    origin_annotations = typing.get_type_hints(origin_type)
-    for attrname in sorted(typing_extensions.get_protocol_members(origin_type)):
+    attrnames, origin_annotations = get_protocol_info(origin_type)
+    for attrname in attrnames:
         if (annotation := origin_annotations.get(attrname)) is not None:
             try:
                 subject_member = getattr(value, attrname)
@@ -898,6 +1244,17 @@ def check_type_internal(
         looking up forward references
     """
 
+    if type(value) is annotation and annotation in _simple_builtin_types:
+        return
+
+    # Instances of plain classes pass without going through the checker lookup
+    if (
+        type(annotation) is type
+        and isinstance(value, annotation)
+        and is_plain_class(annotation)
+    ):
+        return
+
     if isinstance(annotation, ForwardRef):
         try:
             annotation = evaluate_forwardref(annotation, memo)
@@ -920,25 +1277,29 @@ def check_type_internal(
     if not isclass(value) and SubclassableAny in type(value).__bases__:
         return
 
-    extras: tuple[Any, ...]
-    origin_type = get_origin(annotation)
-    if origin_type is Annotated:
-        annotation, *extras_ = get_args(annotation)
-        extras = tuple(extras_)
-        origin_type = get_origin(annotation)
-    else:
-        extras = ()
-
-    if origin_type is not None:
-        args = get_args(annotation)
-
-        # Compatibility hack to distinguish between unparametrized and empty tuple
-        # (tuple[()]), necessary due to https://github.com/python/cpython/issues/91137
-        if origin_type in (tuple, Tuple) and annotation is not Tuple and not args:
-            args = ((),)
-    else:
+    extras: tuple[Any, ...] = ()
+    args: tuple[Any, ...] = ()
+    origin_type: Any
+    if type(annotation) is type:
+        # Plain classes are never parametrized, so skip the introspection
         origin_type = annotation
-        args = ()
+    else:
+        origin_type = get_origin(annotation)
+        if origin_type is Annotated:
+            annotation, *extras_ = get_args(annotation)
+            extras = tuple(extras_)
+            origin_type = get_origin(annotation)
+
+        if origin_type is not None:
+            args = get_args(annotation)
+
+            # Compatibility hack to distinguish between unparametrized and empty
+            # tuple (tuple[()]), necessary due to
+            # https://github.com/python/cpython/issues/91137
+            if origin_type in (tuple, Tuple) and annotation is not Tuple and not args:
+                args = ((),)
+        else:
+            origin_type = annotation
 
     for lookup_func in checker_lookup_functions:
         checker = lookup_func(origin_type, args, extras)
@@ -1006,6 +1367,47 @@ if sys.version_info >= (3, 11):
         {typing.LiteralString: check_literal_string, typing.Self: check_self}
     )
 
+# Checkers from origin_type_checkers that accept every instance of the origin type
+# when the annotation has no type arguments
+_unparametrized_passing_checkers: frozenset[TypeCheckerCallable] = frozenset(
+    [
+        check_byteslike,
+        check_callable,
+        check_class,
+        check_list,
+        check_mapping,
+        check_number,
+        check_sequence,
+        check_set,
+        check_tuple,
+    ]
+)
+
+
+def lookup_class_checker(cls: type) -> TypeCheckerCallable | None:
+    """
+    Return the checker for a class not listed in :data:`origin_type_checkers`.
+
+    The result is cached per class, as it only depends on the class itself.
+
+    """
+    try:
+        return _class_checker_cache[cls]
+    except KeyError:
+        pass
+
+    checker: TypeCheckerCallable | None = None
+    if is_typeddict(cls):
+        checker = check_typed_dict
+    elif issubclass(cls, Tuple):  # type: ignore[arg-type]
+        # NamedTuple
+        checker = check_tuple
+    elif getattr(cls, "_is_protocol", False):
+        checker = check_protocol
+
+    _class_checker_cache[cls] = checker
+    return checker
+
 
 def builtin_checker_lookup(
     origin_type: Any, args: tuple[Any, ...], extras: tuple[Any, ...]
@@ -1013,16 +1415,8 @@ def builtin_checker_lookup(
     checker = origin_type_checkers.get(origin_type)
     if checker is not None:
         return checker
-    elif is_typeddict(origin_type):
-        return check_typed_dict
-    elif isclass(origin_type) and issubclass(
-        origin_type,
-        Tuple,  # type: ignore[arg-type]
-    ):
-        # NamedTuple
-        return check_tuple
-    elif getattr(origin_type, "_is_protocol", False):
-        return check_protocol
+    elif isclass(origin_type):
+        return lookup_class_checker(origin_type)
     elif isinstance(origin_type, ParamSpec):
         return check_paramspec
     elif isinstance(origin_type, TypeVar):
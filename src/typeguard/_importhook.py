@@ -138,11 +138,9 @@ class TypeguardFinder(MetaPathFinder):
         if self.packages is None:
             return True
 
-        for package in self.packages:
-            if module_name == package or module_name.startswith(package + "."):
-                return True
-
-        return False
+        return module_name in self.packages or module_name.startswith(
+            tuple(f"{package}." for package in self.packages)
+        )
 
 
 class ImportHookManager:
@@ -36,8 +36,21 @@ class UnionTransformer(NodeTransformer):
         return node
 
 
+# Compiled type hints, keyed by the source string
+_compiled_type_hints: dict[str, CodeType] = {}
+
+
 def compile_type_hint(hint: str) -> CodeType:
+    try:
+        return _compiled_type_hints[hint]
+    except KeyError:
+        pass
+
     parsed = parse(hint, "<string>", "eval")
-    UnionTransformer().visit(parsed)
+    # Only the | operator needs to be transformed, so skip the tree walk without one
+    if "|" in hint:
+        UnionTransformer().visit(parsed)
+
     fix_missing_locations(parsed)
-    return compile(parsed, "<string>", "eval", flags=0)
+    code = _compiled_type_hints[hint] = compile(parsed, "<string>", "eval", flags=0)
+    return code
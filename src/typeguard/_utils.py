@@ -4,9 +4,8 @@ import inspect
 import sys
 from importlib import import_module
 from inspect import currentframe
-from types import CodeType, FrameType, FunctionType
+from types import FrameType
 from typing import TYPE_CHECKING, Any, Callable, ForwardRef, Union, cast, final
-from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
     from ._memo import TypeCheckMemo
@@ -63,9 +62,6 @@ else:
             raise
 
 
-_functions_map: WeakValueDictionary[CodeType, FunctionType] = WeakValueDictionary()
-
-
 def get_type_name(type_: Any) -> str:
     name: str
     for attrname in "__name__", "_name", "__forward_arg__":
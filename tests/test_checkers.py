@@ -1,8 +1,14 @@
 import collections.abc
+import gc
+import inspect
+import re
 import sys
 import types
+import weakref
+from array import array
 from contextlib import nullcontext
-from functools import partial
+from enum import IntEnum
+from functools import cache, partial
 from io import BytesIO, StringIO
 from pathlib import Path
 from typing import (
@@ -37,6 +43,7 @@ from typing import (
 )
 
 import pytest
+from pytest import MonkeyPatch
 from typing_extensions import LiteralString
 
 from typeguard import (
@@ -47,9 +54,10 @@ from typeguard import (
     TypeHintWarning,
     check_type,
     check_type_internal,
+    checker_lookup_functions,
     suppress_type_checks,
 )
-from typeguard._checkers import is_typeddict
+from typeguard._checkers import is_typeddict, origin_type_checkers
 from typeguard._utils import qualified_name
 
 from . import (
@@ -78,6 +86,25 @@ else:
 P = ParamSpec("P")
 
 
+@pytest.fixture
+def reject_parents_plugin(monkeypatch: MonkeyPatch) -> Callable[[], None]:
+    """Return a function that installs a checker plugin which rejects ``Parent``."""
+
+    def reject_parents(value, origin_type, args, memo):
+        raise TypeCheckError("is rejected by the plugin")
+
+    def lookup_func(origin_type, args, extras):
+        return reject_parents if origin_type is Parent else None
+
+    def install() -> None:
+        monkeypatch.setattr(
+            "typeguard._checkers.checker_lookup_functions",
+            [lookup_func, *checker_lookup_functions],
+        )
+
+    return install
+
+
 @pytest.mark.skipif(
     sys.version_info >= (3, 13), reason="AnyStr is deprecated on Python 3.13"
 )
@@ -231,6 +258,38 @@ class TestCallable:
         """
         check_type(Child().method, Callable[[int], Any])
 
+    def test_bound_method_repeated(self):
+        """
+        Test that the signature of a bound method is still correct when it's been
+        looked up earlier through another instance or through the class.
+
+        """
+        check_type(Child.method, Callable[[Child, int], Any])
+        check_type(Child().method, Callable[[int], Any])
+        pytest.raises(
+            TypeCheckError, check_type, Child().method, Callable[[int, str], Any]
+        ).match("has too few arguments in its declaration")
+
+    def test_defaults_reassigned(self):
+        def some_callable(x: int = 1) -> None:
+            pass
+
+        check_type(some_callable, Callable[[], Any])
+        some_callable.__defaults__ = None
+        pytest.raises(
+            TypeCheckError, check_type, some_callable, Callable[[], Any]
+        ).match("has too many mandatory positional arguments in its declaration")
+
+    def test_signature_reassigned(self):
+        def some_callable(x: int) -> None:
+            pass
+
+        check_type(some_callable, Callable[[int], Any])
+        some_callable.__signature__ = inspect.Signature()
+        pytest.raises(
+            TypeCheckError, check_type, some_callable, Callable[[int], Any]
+        ).match("has too few arguments in its declaration")
+
     def test_partial_bound_method(self):
         """
         Test that passing a bound method as a callable does not count the "self"
@@ -291,6 +350,21 @@ class TestLiteral:
         pytest.raises(TypeCheckError, check_type, 0, Literal[False])
         pytest.raises(TypeCheckError, check_type, 1, Literal[True])
 
+    def test_literal_bool_after_equal_int(self):
+        check_type(True, Literal[1, True])
+        check_type(1, Literal[True, 1])
+
+    def test_literal_bool_after_int_literal(self):
+        check_type(1, Literal[1])
+        check_type(True, Literal[True])
+
+    def test_literal_int_enum_after_int_literal(self):
+        class Number(IntEnum):
+            one = 1
+
+        check_type(1, Literal[1])
+        check_type(Number.one, Literal[Number.one])
+
     def test_literal_illegal_value(self):
         pytest.raises(TypeError, check_type, 4, Literal[1, 1.1]).match(
             r"Illegal literal value: 1.1$"
@@ -441,6 +515,39 @@ class TestDict:
 
         check_type(CustomDict(a=1), Dict[str, int])
 
+    def test_custom_dict_generator_items_fail(self):
+        class CustomDict(dict):
+            def items(self):
+                for key in self:
+                    yield key, self[key]
+
+        pytest.raises(
+            TypeCheckError,
+            check_type,
+            CustomDict(a=1, b="x"),
+            Dict[str, int],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        ).match("value of key 'b' of .*CustomDict is not an instance of int")
+
+    def test_any_value_type_full_check(self):
+        pytest.raises(
+            TypeCheckError,
+            check_type,
+            {"x": 1, 2: "a"},
+            Dict[str, Any],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        ).match("key 2 of dict is not an instance of str")
+
+
+@cache
+def make_dummy_typed_dict(typing_provider: types.ModuleType, total: bool) -> type:
+    # Shared between parametrized test runs to only create each class once
+    class DummyDict(typing_provider.TypedDict, total=total):
+        x: int
+        y: str
+
+    return DummyDict
+
 
 class TestTypedDict:
     @pytest.mark.parametrize(
@@ -450,43 +557,46 @@ class TestTypedDict:
             pytest.param(
                 {"y": "foo"},
                 True,
-                r'dict is missing required key\(s\): "x"',
+                re.compile(r'dict is missing required key\(s\): "x"'),
                 id="missing_x",
             ),
             pytest.param(
-                {"x": 6, "y": 3}, True, "dict is not an instance of str", id="wrong_y"
+                {"x": 6, "y": 3},
+                True,
+                re.compile("dict is not an instance of str"),
+                id="wrong_y",
             ),
             pytest.param(
                 {"x": 6},
                 True,
-                r'is missing required key\(s\): "y"',
+                re.compile(r'is missing required key\(s\): "y"'),
                 id="missing_y_error",
             ),
             pytest.param({"x": 6}, False, None, id="missing_y_ok"),
             pytest.param(
-                {"x": "abc"}, False, "dict is not an instance of int", id="wrong_x"
+                {"x": "abc"},
+                False,
+                re.compile("dict is not an instance of int"),
+                id="wrong_x",
             ),
             pytest.param(
                 {"x": 6, "foo": "abc"},
                 False,
-                r'dict has unexpected extra key\(s\): "foo"',
+                re.compile(r'dict has unexpected extra key\(s\): "foo"'),
                 id="unknown_key",
             ),
             pytest.param(
                 None,
                 True,
-                "is not a dict",
+                re.compile("is not a dict"),
                 id="not_dict",
             ),
         ],
     )
     def test_typed_dict(
-        self, value, total: bool, error_re: Optional[str], typing_provider
+        self, value, total: bool, error_re: Optional[re.Pattern[str]], typing_provider
     ):
-        class DummyDict(typing_provider.TypedDict, total=total):
-            x: int
-            y: str
-
+        DummyDict = make_dummy_typed_dict(typing_provider, total)
         if error_re:
             pytest.raises(TypeCheckError, check_type, value, DummyDict).match(error_re)
         else:
@@ -569,6 +679,27 @@ class TestList:
             collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
         ).match("list is not an instance of int")
 
+    def test_full_check_mixed_builtin_types(self):
+        check_type(
+            [1.5, 2, True],
+            List[float],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        )
+
+    def test_full_check_fail_after_exact_matches(self):
+        pytest.raises(
+            TypeCheckError,
+            check_type,
+            [1, 2, 3, b"x"],
+            List[int],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        ).match(r"item 3 of list is not an instance of int")
+
+    def test_named_tuple_items_fail(self):
+        pytest.raises(
+            TypeCheckError, check_type, [Employee(2, 1)], List[Employee]
+        ).match(r"attribute 'name' of item 0 of list is not an instance of str")
+
 
 class TestSequence:
     def test_bad_type(self):
@@ -600,6 +731,26 @@ class TestSequence:
             collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
         ).match("list is not an instance of int")
 
+    @pytest.mark.parametrize(
+        "value, annotation",
+        [
+            pytest.param(array("q", [1, 2]), Sequence[int], id="int"),
+            pytest.param(array("d", [1.5]), Sequence[float], id="float"),
+            pytest.param(array("i", [1, 2]), Sequence[float], id="int_as_float"),
+        ],
+    )
+    def test_array(self, value, annotation):
+        check_type(
+            value,
+            annotation,
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        )
+
+    def test_array_fail(self):
+        pytest.raises(
+            TypeCheckError, check_type, array("d", [1.5]), Sequence[int]
+        ).match("array.array is not an instance of int")
+
 
 class TestAbstractSet:
     def test_custom_type(self):
@@ -741,6 +892,9 @@ class TestTuple:
             TypeCheckError, check_type, (1, 2), annotated_type[int, str]
         ).match("tuple is not an instance of str")
 
+    def test_int_for_float_element(self, annotated_type: Any):
+        check_type((1, 2.5), annotated_type[float, float])
+
     def test_ellipsis_bad_element(self, annotated_type: Any):
         pytest.raises(
             TypeCheckError, check_type, ("blah",), annotated_type[int, ...]
@@ -755,6 +909,13 @@ class TestTuple:
             collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
         ).match("tuple is not an instance of int")
 
+    def test_ellipsis_any_full_check(self, annotated_type: Any):
+        check_type(
+            ("a", 1),
+            annotated_type[Any, ...],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        )
+
     def test_empty_tuple(self, annotated_type: Any):
         check_type((), annotated_type[()])
 
@@ -786,6 +947,9 @@ class TestUnion:
     def test_valid(self, value):
         check_type(value, Union[str, int])
 
+    def test_any_member(self):
+        check_type("aa", Union[int, Any])
+
     def test_typing_type_fail(self):
         pytest.raises(TypeCheckError, check_type, 1, Union[str, Collection]).match(
             "int did not match any element in the union:\n"
@@ -819,6 +983,20 @@ class TestUnion:
             f"  int: is not an instance of int"
         )
 
+    def test_named_tuple_member_fail(self):
+        pytest.raises(
+            TypeCheckError, check_type, Employee(2, 1), Union[int, Employee]
+        ).match(r"Employee: attribute 'name' is not an instance of str")
+
+    def test_plugin_checked_member(
+        self, reject_parents_plugin: Callable[[], None]
+    ) -> None:
+        check_type(Parent(), Union[Parent, str])
+        reject_parents_plugin()
+        pytest.raises(TypeCheckError, check_type, Parent(), Union[Parent, str]).match(
+            "Parent: is rejected by the plugin"
+        )
+
     @pytest.mark.skipif(
         sys.implementation.name != "cpython",
         reason="Test relies on CPython's reference counting behavior",
@@ -1048,6 +1226,18 @@ class TestIO:
         with tmp_path.joinpath("testfile").open("w") as f:
             check_type(f, TextIO)
 
+    @pytest.mark.parametrize(
+        "annotation",
+        [pytest.param(IO, id="direct"), pytest.param(Union[IO, int], id="union")],
+    )
+    def test_typing_io_subclass_fail(self, annotation):
+        class FakeIO(IO[str]):
+            pass
+
+        pytest.raises(TypeCheckError, check_type, FakeIO(), annotation).match(
+            "is not an I/O object"
+        )
+
 
 class TestIntersectingProtocol:
     SIT = TypeVar("SIT", covariant=True)
@@ -1497,9 +1687,41 @@ def test_imported_str_forward_ref():
         check_type_internal(value, "Dict[str, int]", memo)
 
 
+def test_annotation_class_not_retained():
+    def check_local_class():
+        class Local:
+            pass
+
+        check_type(Local(), Local)
+        return weakref.ref(Local)
+
+    local_ref = check_local_class()
+    gc.collect()
+    assert local_ref() is None
+
+
 def test_check_against_tuple_success():
     check_type(1, (float, Union[str, int]))
 
 
 def test_check_against_tuple_failure():
     pytest.raises(TypeCheckError, check_type, "aa", (int, bytes))
+
+
+def test_plugin_checked_plain_class(reject_parents_plugin: Callable[[], None]) -> None:
+    check_type(Parent(), Parent)
+    reject_parents_plugin()
+    pytest.raises(TypeCheckError, check_type, Parent(), Parent).match(
+        "Parent is rejected by the plugin"
+    )
+
+
+def test_origin_type_checked_plain_class(monkeypatch: MonkeyPatch) -> None:
+    def reject_parents(value, origin_type, args, memo):
+        raise TypeCheckError("is rejected by the origin type checker")
+
+    check_type([Parent()], List[Parent])
+    monkeypatch.setitem(origin_type_checkers, Parent, reject_parents)
+    pytest.raises(TypeCheckError, check_type, [Parent()], List[Parent]).match(
+        r"item 0 of list is rejected by the origin type checker"
+    )
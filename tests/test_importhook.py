@@ -59,6 +59,20 @@ def test_package_name_matching():
     assert not finder.should_instrument("spam_eggs")
 
 
+def test_package_name_matching_after_update():
+    """
+    Changes to the finder's package list are picked up by subsequent checks.
+    """
+    finder = TypeguardFinder(["ham"], None)
+    finder.packages = ["spam"]
+
+    assert finder.should_instrument("spam")
+    assert finder.should_instrument("spam.eggs")
+
+    assert not finder.should_instrument("ham")
+    assert not finder.should_instrument("ham.eggs")
+
+
 @pytest.mark.skipif(sys.version_info < (3, 9), reason="Requires ast.unparse()")
 def test_debug_instrumentation(monkeypatch, capsys):
     monkeypatch.setattr("typeguard.config.debug_instrumentation", True)
@@ -1,3 +1,4 @@
+import re
 import typing
 from typing import Callable, Union
 
@@ -6,6 +7,7 @@ from typing_extensions import Literal
 
 from typeguard._union_transformer import compile_type_hint
 
+typing_prefix_re = re.compile(r"typing(?:_extensions)?\.")
 eval_globals = {
     "Callable": Callable,
     "Literal": Literal,
@@ -38,7 +40,11 @@ eval_globals = {
 def test_union_transformer(inputval: str, expected: str) -> None:
     code = compile_type_hint(inputval)
     evaluated = eval(code, eval_globals)
-    evaluated_repr = repr(evaluated)
-    evaluated_repr = evaluated_repr.replace("typing.", "")
-    evaluated_repr = evaluated_repr.replace("typing_extensions.", "")
+    evaluated_repr = typing_prefix_re.sub("", repr(evaluated))
     assert evaluated_repr == expected
+
+
+def test_compiled_type_hints_are_cached() -> None:
+    code = compile_type_hint("str | int")
+    assert compile_type_hint("str | int") is code
+    assert compile_type_hint("int | str") is not code
@@ -18,5 +18,18 @@ def test_qualified_name(inputval, add_class_prefix, expected):
     assert qualified_name(inputval, add_class_prefix=add_class_prefix) == expected
 
 
+def test_qualified_name_renamed_class():
+    class Foo:
+        pass
+
+    assert (
+        qualified_name(Foo)
+        == "tests.test_utils.test_qualified_name_renamed_class.<locals>.Foo"
+    )
+    Foo.__module__ = "bar"
+    Foo.__qualname__ = "Baz"
+    assert qualified_name(Foo) == "bar.Baz"
+
+
 def test_function_name():
     assert function_name(function_name) == "typeguard._utils.function_name"
@@ -5,7 +5,7 @@ import pytest
 from typeguard import TypeCheckWarning, check_type, config, typechecked, warn_on_error
 
 
-def test_check_type(recwarn):
+def test_check_type():
     with pytest.warns(TypeCheckWarning) as warning:
         check_type(1, str, typecheck_fail_callback=warn_on_error)
 
@@ -14,7 +14,7 @@ def test_check_type(recwarn):
     assert warning.list[0].lineno == test_check_type.__code__.co_firstlineno + 2
 
 
-def test_typechecked(monkeypatch, recwarn):
+def test_typechecked(monkeypatch):
     @typechecked
     def foo() -> List[int]:
         return ["aa"]  # type: ignore[list-item]